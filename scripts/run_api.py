@@ -0,0 +1,29 @@
+"""Run the DiagnoML API with the fastest available uvicorn transport."""
+
+import sys
+
+import uvicorn
+
+from src.utils.config import get_settings
+
+
+def main() -> None:
+    """Start uvicorn using uvloop and httptools where supported."""
+    settings = get_settings()
+
+    # uvloop does not support Windows; fall back to the asyncio loop there.
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+
+    uvicorn.run(
+        "src.api.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        loop=loop,
+        http="httptools",
+        workers=settings.api_workers,
+        log_level=settings.log_level.lower(),
+    )
+
+
+if __name__ == "__main__":
+    main()
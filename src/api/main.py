@@ -1,9 +1,44 @@
 """FastAPI application entry point for DiagnoML."""
 
-from fastapi import FastAPI
+import json
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from src import __version__
+from src.utils.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Constant payloads, encoded once at import so probes do no per-request work
+_HEALTH_JSON = json.dumps(
+    {"status": "healthy", "version": __version__}, separators=(",", ":")
+).encode()
+_ROOT_JSON = json.dumps(
+    {"message": "Welcome to DiagnoML API", "version": __version__},
+    separators=(",", ":"),
+).encode()
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Configure process-wide resources for the lifetime of the app.
+
+    Args:
+        _app: The FastAPI application being started.
+
+    Yields:
+        Control back to the server while the app is running.
+    """
+    thread_limit = get_settings().api_thread_limit
+    anyio.to_thread.current_default_thread_limiter().total_tokens = thread_limit
+    logger.info("Threadpool limit for sync handlers set to %d", thread_limit)
+    yield
+
 
 app = FastAPI(
     title="DiagnoML API",
@@ -11,6 +46,7 @@ app = FastAPI(
     version=__version__,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -22,22 +58,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Handler convention: constant or O(1) endpoints stay ``async def`` and run
+# directly on the event loop. Anything that does blocking I/O or more than
+# about a millisecond of CPU work must be a plain ``def`` so Starlette
+# offloads it to the threadpool instead of stalling every other request.
+#
+# /health and / return their pre-encoded bodies as a plain Response, which
+# FastAPI passes through unchanged; response_model is only kept so the OpenAPI
+# schema still documents the payload.
+
 
-@app.get("/health")
-async def health_check() -> dict[str, str]:
+@app.get("/health", response_model=dict[str, str])
+async def health_check() -> Response:
     """Health check endpoint.
 
     Returns:
-        Health status response.
+        Pre-encoded health status response.
     """
-    return {"status": "healthy", "version": __version__}
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
 
-@app.get("/")
-async def root() -> dict[str, str]:
+@app.get("/", response_model=dict[str, str])
+async def root() -> Response:
     """Root endpoint.
 
     Returns:
-        Welcome message.
+        Pre-encoded welcome message.
     """
-    return {"message": "Welcome to DiagnoML API", "version": __version__}
+    return Response(content=_ROOT_JSON, media_type="application/json")
@@ -1,5 +1,9 @@
 """Application configuration using Pydantic Settings."""
 
+import os
+from functools import lru_cache
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +15,9 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # Defaults are trusted constants; values from env/.env are still validated
+        validate_default=False,
+        frozen=True,
     )
 
     # GCP
@@ -38,9 +45,37 @@ class Settings(BaseSettings):
     api_host: str = "0.0.0.0"  # noqa: S104 # nosec B104 - intentional for Docker
     api_port: int = 8000
     api_debug: bool = False
+    api_workers: int = 1
+    # Worker threads available to sync (``def``) handlers; caps oversubscription
+    api_thread_limit: int = Field(default=min(32, (os.cpu_count() or 1) * 2), ge=1)
 
     # Logging
     log_level: str = "INFO"
 
+    @classmethod
+    def defaults(cls) -> "Settings":
+        """Build settings from field defaults only.
+
+        Skips reading the environment and the ``.env`` file, as well as
+        validation, which is useful where only default values are needed.
+
+        Returns:
+            Settings instance populated with default values.
+        """
+        return cls.model_construct()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance.
+
+    The ``.env`` file and environment are only read on the first call; use
+    this as a FastAPI dependency via ``Depends(get_settings)``.
+
+    Returns:
+        Cached application settings.
+    """
+    return Settings()
+
 
-settings = Settings()
+settings = get_settings()
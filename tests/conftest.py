@@ -1,10 +1,46 @@
 """Pytest configuration and shared fixtures for DiagnoML tests."""
 
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
+from types import MappingProxyType
 from typing import Any
 
 import pytest
 
+# Shared sample records, built once per session. Values are all immutable, so
+# a shallow copy is enough for the mutable fixture variants.
+_SAMPLE_PATIENT_DATA: Mapping[str, Any] = MappingProxyType(
+    {
+        "pseudonym": "PID-TEST123456",
+        "geschlecht": "m",
+        "altersgruppe": "46-60",
+        "raucher_status": "ja",
+        "raucher_zeitraum_kategorie": "5-15y",
+        "raucher_menge_kategorie": "10-20",
+        "alkohol_status": "nein",
+        "alkohol_zeitraum_kategorie": None,
+        "drogen_status": "nein",
+        "drogen_zeitraum_kategorie": None,
+        "sport_niveau": "wenig",
+        "sport_stunden_kategorie": "1-3",
+        "hba1c": 5.8,
+        "cholesterol_total": 210.0,
+        "crp": 2.5,
+        "created_at": "2024-01-15T10:30:00Z",
+        "data_version": "1.0.0",
+    }
+)
+
+_SAMPLE_ANALYSIS_RESULT: Mapping[str, Any] = MappingProxyType(
+    {
+        "pseudonym": "PID-TEST123456",
+        "diagnosis_probability": 0.73,
+        "risk_category": "high",
+        "confidence_score": 0.85,
+        "model_version": "1.0.0",
+        "prediction_timestamp": "2024-01-15T11:00:00Z",
+    }
+)
+
 
 @pytest.fixture(scope="session")
 def test_settings() -> dict[str, Any]:
@@ -23,48 +59,45 @@ def test_settings() -> dict[str, Any]:
 
 
 @pytest.fixture
-def sample_patient_data() -> dict[str, Any]:
+def sample_patient_data() -> Mapping[str, Any]:
     """Provide sample patient data for testing.
 
+    Returns:
+        Read-only mapping with sample patient data matching the minimal
+        dataset schema. Use ``sample_patient_data_mut`` to modify it.
+    """
+    return _SAMPLE_PATIENT_DATA
+
+
+@pytest.fixture
+def sample_patient_data_mut() -> dict[str, Any]:
+    """Provide a mutable copy of the sample patient data.
+
     Returns:
         Dictionary with sample patient data matching the minimal dataset schema.
     """
-    return {
-        "pseudonym": "PID-TEST123456",
-        "geschlecht": "m",
-        "altersgruppe": "46-60",
-        "raucher_status": "ja",
-        "raucher_zeitraum_kategorie": "5-15y",
-        "raucher_menge_kategorie": "10-20",
-        "alkohol_status": "nein",
-        "alkohol_zeitraum_kategorie": None,
-        "drogen_status": "nein",
-        "drogen_zeitraum_kategorie": None,
-        "sport_niveau": "wenig",
-        "sport_stunden_kategorie": "1-3",
-        "hba1c": 5.8,
-        "cholesterol_total": 210.0,
-        "crp": 2.5,
-        "created_at": "2024-01-15T10:30:00Z",
-        "data_version": "1.0.0",
-    }
+    return dict(_SAMPLE_PATIENT_DATA)
 
 
 @pytest.fixture
-def sample_analysis_result() -> dict[str, Any]:
+def sample_analysis_result() -> Mapping[str, Any]:
     """Provide sample analysis result for testing.
 
+    Returns:
+        Read-only mapping with sample analysis result. Use
+        ``sample_analysis_result_mut`` to modify it.
+    """
+    return _SAMPLE_ANALYSIS_RESULT
+
+
+@pytest.fixture
+def sample_analysis_result_mut() -> dict[str, Any]:
+    """Provide a mutable copy of the sample analysis result.
+
     Returns:
         Dictionary with sample analysis result.
     """
-    return {
-        "pseudonym": "PID-TEST123456",
-        "diagnosis_probability": 0.73,
-        "risk_category": "high",
-        "confidence_score": 0.85,
-        "model_version": "1.0.0",
-        "prediction_timestamp": "2024-01-15T11:00:00Z",
-    }
+    return dict(_SAMPLE_ANALYSIS_RESULT)
 
 
 @pytest.fixture(scope="function")
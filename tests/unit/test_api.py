@@ -0,0 +1,65 @@
+"""Unit tests for the FastAPI application."""
+
+from collections.abc import Generator
+
+import anyio.to_thread
+import pytest
+from fastapi.testclient import TestClient
+
+from src import __version__
+from src.api.main import app
+from src.utils.config import get_settings
+
+
+@pytest.fixture
+def client() -> Generator[TestClient, None, None]:
+    """Provide a test client with the app lifespan running.
+
+    Yields:
+        TestClient bound to the DiagnoML API.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.mark.unit
+class TestEndpoints:
+    """Test cases for the top-level API endpoints."""
+
+    def test_health_check(self, client: TestClient) -> None:
+        """Test that the health endpoint reports a healthy status."""
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy", "version": __version__}
+
+    def test_root(self, client: TestClient) -> None:
+        """Test that the root endpoint returns the welcome message."""
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "message": "Welcome to DiagnoML API",
+            "version": __version__,
+        }
+
+    def test_constant_endpoints_documented(self, client: TestClient) -> None:
+        """Test that pre-encoded endpoints keep their OpenAPI response schema."""
+        paths = client.get("/openapi.json").json()["paths"]
+
+        for path in ("/", "/health"):
+            content = paths[path]["get"]["responses"]["200"]["content"]
+            assert content["application/json"]["schema"]["type"] == "object"
+
+
+@pytest.mark.unit
+class TestLifespan:
+    """Test cases for application startup configuration."""
+
+    def test_thread_limit_applied(self, client: TestClient) -> None:
+        """Test that startup caps the threadpool at the configured limit."""
+        assert client.portal is not None
+
+        limiter = client.portal.call(anyio.to_thread.current_default_thread_limiter)
+
+        assert limiter.total_tokens == get_settings().api_thread_limit
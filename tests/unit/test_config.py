@@ -1,8 +1,12 @@
 """Unit tests for configuration module."""
 
+from typing import Any
+
 import pytest
+from pydantic import ValidationError
 
-from src.utils.config import Settings
+from src.utils import config
+from src.utils.config import Settings, get_settings
 
 
 @pytest.mark.unit
@@ -11,24 +15,95 @@ class TestSettings:
 
     def test_default_settings(self) -> None:
         """Test that default settings are loaded correctly."""
-        settings = Settings()
+        settings = Settings.defaults()
 
         assert settings.gcp_project_id == "diagnoml-poc"
         assert settings.bq_dataset == "diagnoml_warehouse"
         assert settings.api_port == 8000
 
-    def test_settings_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.parametrize(
+        ("env", "expected"),
+        [
+            (
+                {"GCP_PROJECT_ID": "test-project", "API_PORT": "9000"},
+                {"gcp_project_id": "test-project", "api_port": 9000},
+            ),
+            (
+                {"API_DEBUG": "true", "API_WORKERS": "4"},
+                {"api_debug": True, "api_workers": 4},
+            ),
+            ({"LOG_LEVEL": "DEBUG"}, {"log_level": "DEBUG"}),
+        ],
+    )
+    def test_settings_from_env(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        env: dict[str, str],
+        expected: dict[str, Any],
+    ) -> None:
         """Test that settings can be overridden from environment variables."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        settings = Settings()
+
+        for field, value in expected.items():
+            assert getattr(settings, field) == value
+
+    def test_defaults_ignore_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that Settings.defaults() does not read environment variables."""
         monkeypatch.setenv("GCP_PROJECT_ID", "test-project")
-        monkeypatch.setenv("API_PORT", "9000")
 
+        settings = Settings.defaults()
+
+        assert settings.gcp_project_id == "diagnoml-poc"
+
+    @pytest.mark.parametrize(
+        "env",
+        [
+            {"API_PORT": "not-a-port"},
+            {"API_THREAD_LIMIT": "0"},
+            {"API_THREAD_LIMIT": "-1"},
+        ],
+    )
+    def test_settings_env_values_validated(
+        self, monkeypatch: pytest.MonkeyPatch, env: dict[str, str]
+    ) -> None:
+        """Test that invalid environment values are still rejected."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        with pytest.raises(ValidationError):
+            Settings()
+
+    def test_settings_frozen(self) -> None:
+        """Test that settings cannot be modified after construction."""
         settings = Settings()
 
-        assert settings.gcp_project_id == "test-project"
-        assert settings.api_port == 9000
+        with pytest.raises(ValidationError):
+            settings.api_port = 9000  # type: ignore[misc]
 
     def test_settings_log_level_default(self) -> None:
         """Test that log level defaults to INFO."""
-        settings = Settings()
+        settings = Settings.defaults()
 
         assert settings.log_level == "INFO"
+
+    def test_settings_thread_limit_default(self) -> None:
+        """Test that the threadpool limit defaults to a bounded positive value."""
+        settings = Settings.defaults()
+
+        assert 1 <= settings.api_thread_limit <= 32
+
+
+@pytest.mark.unit
+class TestGetSettings:
+    """Test cases for the cached settings accessor."""
+
+    def test_returns_singleton(self) -> None:
+        """Test that repeated calls return the same cached instance."""
+        assert get_settings() is get_settings()
+
+    def test_module_settings_is_cached_instance(self) -> None:
+        """Test that the module-level settings is the cached instance."""
+        assert config.settings is get_settings()